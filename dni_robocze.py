@@ -6,23 +6,40 @@ public holidays (14 from 2025+, 13 before). Easter dates are calculated
 dynamically for any year.
 """
 
-import argparse
+from __future__ import annotations
+
 import datetime
+import re
 import sys
-from importlib import metadata
-from typing import List, NoReturn, Optional, Set, Tuple, Union
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, FrozenSet, NoReturn, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Only needed for annotations; imported for real inside main().
+    import argparse
 
 
 def _get_version() -> str:
+    # importlib.metadata walks sys.path; only pay for it when the version
+    # is actually requested.
+    from importlib import metadata
+
     try:
         return metadata.version("dni-robocze-pl")
     except metadata.PackageNotFoundError:
         return "1.1.0"
 
 
-__version__ = _get_version()
+def __getattr__(name: str) -> str:
+    # PEP 562: resolve __version__ lazily instead of at import time.
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+@lru_cache(maxsize=64)
 def calculate_easter(year: int) -> datetime.date:
     """Calculate Easter Sunday date for a given year using the anonymous algorithm.
     (Meeus/Jones/Butcher's algorithm)
@@ -46,37 +63,19 @@ def calculate_easter(year: int) -> datetime.date:
     return datetime.date(year, month, day)
 
 
-def get_holidays(year: int) -> Set[datetime.date]:
-    """Return a set of datetime.date for all Polish public holidays in a given year."""
-    try:
-        easter = calculate_easter(year)
-    except ValueError:
-        # datetime.date might fail for extremely far future/past years if outside supported range
-        raise ValueError(f"Rok {year} nie jest obsługiwany przez bibliotekę datetime.")
+# Bounds of the datetime library (years 1-9999), bound once for the happy-path
+# range checks below.
+_MIN_YEAR, _MAX_YEAR = datetime.MINYEAR, datetime.MAXYEAR
 
-    holidays = {
-        # Fixed-date holidays
-        datetime.date(year, 1, 1),  # Nowy Rok
-        datetime.date(year, 1, 6),  # Trzech Króli
-        datetime.date(year, 5, 1),  # Święto Pracy
-        datetime.date(year, 5, 3),  # Święto Konstytucji 3 Maja
-        datetime.date(year, 8, 15),  # Wniebowzięcie NMP
-        datetime.date(year, 11, 1),  # Wszystkich Świętych
-        datetime.date(year, 11, 11),  # Święto Niepodległości
-        datetime.date(year, 12, 25),  # Boże Narodzenie (pierwszy dzień)
-        datetime.date(year, 12, 26),  # Boże Narodzenie (drugi dzień)
-        # Moveable holidays (Easter-dependent)
-        easter,  # Wielkanoc
-        easter + datetime.timedelta(days=1),  # Poniedziałek Wielkanocny
-        easter + datetime.timedelta(days=49),  # Zielone Świątki
-        easter + datetime.timedelta(days=60),  # Boże Ciało
-    }
 
-    # Wigilia — dzień wolny od pracy od 2025 roku
-    if year >= 2025:
-        holidays.add(datetime.date(year, 12, 24))
+@lru_cache(maxsize=16)
+def get_holidays(year: int) -> FrozenSet[datetime.date]:
+    """Return a frozenset of datetime.date for all Polish public holidays in a given year.
 
-    return holidays
+    Derived from the named-holiday table so each year's date objects are
+    constructed once and shared with get_holidays_with_names.
+    """
+    return frozenset(d for d, _name in get_holidays_with_names(year))
 
 
 HOLIDAY_NAMES = [
@@ -95,12 +94,15 @@ HOLIDAY_NAMES = [
 WIGILIA = (12, 24, "Wigilia Bożego Narodzenia")
 
 
-def get_holidays_with_names(year: int) -> List[Tuple[datetime.date, str]]:
-    """Return a sorted list of (date, name) tuples for all holidays in a year."""
-    try:
-        easter = calculate_easter(year)
-    except ValueError:
-         raise ValueError(f"Rok {year} nie jest obsługiwany przez bibliotekę datetime.")
+@lru_cache(maxsize=16)
+def get_holidays_with_names(year: int) -> Tuple[Tuple[datetime.date, str], ...]:
+    """Return a sorted tuple of (date, name) pairs for all holidays in a year.
+
+    A tuple (not a list) so callers cannot mutate the cached result.
+    """
+    if year < _MIN_YEAR or year > _MAX_YEAR:
+        raise ValueError(f"Rok {year} nie jest obsługiwany przez bibliotekę datetime.")
+    easter = calculate_easter(year)
 
     result = []
     for month, day, name in HOLIDAY_NAMES:
@@ -115,19 +117,92 @@ def get_holidays_with_names(year: int) -> List[Tuple[datetime.date, str]]:
     result.append((easter + datetime.timedelta(days=49), "Zielone Świątki"))
     result.append((easter + datetime.timedelta(days=60), "Boże Ciało"))
 
-    result.sort(key=lambda x: x[0])
-    return result
+    result.sort(key=itemgetter(0))
+    return tuple(result)
 
 
 def is_workday(date: datetime.date) -> bool:
     """Return True if the given date is a work day (not weekend, not holiday)."""
-    if date.weekday() >= 5:  # Saturday=5, Sunday=6
+    # Weekday from the ordinal (ordinal 1 = a Monday): Saturday/Sunday are 5/6.
+    o = date.toordinal()
+    if (o - 1) % 7 >= 5:
         return False
-    try:
-        holidays = get_holidays(date.year)
-    except ValueError:
-        raise
-    return date not in holidays
+    return o not in _holiday_ordinals(date.year)
+
+
+@lru_cache(maxsize=16)
+def _holiday_ordinals(year: int) -> frozenset:
+    """Holiday dates of a year as proleptic-Gregorian ordinals (ints)."""
+    return frozenset(h.toordinal() for h in get_holidays(year))
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+: dispatches to hardware POPCNT
+except AttributeError:
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+@lru_cache(maxsize=16)
+def _workday_ordinals(year: int) -> Tuple[int, ...]:
+    """Sorted tuple of the work-day ordinals of a year."""
+    first = datetime.date(year, 1, 1).toordinal()
+    last = datetime.date(year, 12, 31).toordinal()
+    holidays = _holiday_ordinals(year)
+    return tuple(
+        o for o in range(first, last + 1)
+        if (o - 1) % 7 < 5 and o not in holidays
+    )
+
+
+@lru_cache(maxsize=16)
+def _holiday_weekday_bits(year: int) -> Tuple[int, int, int]:
+    """Weekday (Mon-Fri) holidays of a year as a bitmask.
+
+    Returns (jan1_ordinal, days_in_year, bits) where bit i is set when the
+    day i days after 1 January is a holiday falling on a weekday.
+    """
+    first = datetime.date(year, 1, 1).toordinal()
+    days = datetime.date(year, 12, 31).toordinal() - first + 1
+    bits = 0
+    for o in _holiday_ordinals(year):
+        if (o - 1) % 7 < 5:
+            bits |= 1 << (o - first)
+    return first, days, bits
+
+
+# _WEEKDAYS_IN_REMAINDER[w][rem] = how many of the first `rem` days of a span
+# starting on weekday `w` (Monday=0) fall on a weekday (Mon-Fri).
+_WEEKDAYS_IN_REMAINDER = tuple(
+    tuple(sum(1 for i in range(rem) if (w + i) % 7 < 5) for rem in range(7))
+    for w in range(7)
+)
+
+
+def _span_workdays(start_ord: int, end_ord: int, year: int) -> int:
+    """Work days in the ordinal range [start_ord, end_ord] within one year.
+
+    Weekday count in closed form: full weeks contribute 5 days each, the
+    remainder is a table lookup keyed on the starting weekday. Weekday
+    holidays are subtracted by masking the cached per-year bitmask with
+    the query window and popcounting the overlap.
+    """
+    full_weeks, rem = divmod(end_ord - start_ord + 1, 7)
+    count = full_weeks * 5 + _WEEKDAYS_IN_REMAINDER[(start_ord - 1) % 7][rem]
+
+    first, _days, bits = _holiday_weekday_bits(year)
+    window = (1 << (end_ord - first + 1)) - (1 << (start_ord - first))
+    return count - _popcount(bits & window)
+
+
+@lru_cache(maxsize=32)
+def _workdays_in_year(year: int) -> int:
+    """Total work days in a calendar year."""
+    return _span_workdays(
+        datetime.date(year, 1, 1).toordinal(),
+        datetime.date(year, 12, 31).toordinal(),
+        year,
+    )
 
 
 def count_workdays(start: datetime.date, end: datetime.date) -> int:
@@ -135,18 +210,22 @@ def count_workdays(start: datetime.date, end: datetime.date) -> int:
     if start > end:
         raise ValueError("Data początkowa nie może być późniejsza niż data końcowa.")
 
-    years_needed = set(range(start.year, end.year + 1))
-    all_holidays = set()
-    for y in years_needed:
-        all_holidays.update(get_holidays(y))
-
-    count = 0
-    current = start
-    one_day = datetime.timedelta(days=1)
-    while current <= end:
-        if current.weekday() < 5 and current not in all_holidays:
-            count += 1
-        current += one_day
+    start_ord = start.toordinal()
+    end_ord = end.toordinal()
+
+    if start.year == end.year:
+        return _span_workdays(start_ord, end_ord, start.year)
+
+    # Partial head and tail years plus cached totals for the whole years
+    # in between.
+    count = _span_workdays(
+        start_ord, datetime.date(start.year, 12, 31).toordinal(), start.year
+    )
+    for y in range(start.year + 1, end.year):
+        count += _workdays_in_year(y)
+    count += _span_workdays(
+        datetime.date(end.year, 1, 1).toordinal(), end_ord, end.year
+    )
     return count
 
 
@@ -159,69 +238,111 @@ def add_workdays(start: datetime.date, n: int) -> datetime.date:
     if n == 0:
         return start
 
-    direction = 1 if n > 0 else -1
-    remaining = abs(n)
-    current = start
-    one_day = datetime.timedelta(days=direction)
-
-    while remaining > 0:
-        current += one_day
-        # Since we removed explicit supported years check, this loop just proceeds.
-        # However, datetime constraints still apply (years 1-9999).
-        if is_workday(current):
-            remaining -= 1
-
-    return current
-
-
-DAY_NAMES_PL = {
-    0: "poniedziałek",
-    1: "wtorek",
-    2: "środa",
-    3: "czwartek",
-    4: "piątek",
-    5: "sobota",
-    6: "niedziela",
-}
+    # Index into cached per-year tables of work-day ordinals: a binary
+    # search locates the start inside its year, then whole years are
+    # skipped by their table lengths until the target falls inside one.
+    # datetime constraints still apply (years 1-9999) via the date
+    # construction in _workday_ordinals.
+    start_ord = start.toordinal()
+    year = start.year
+    ords = _workday_ordinals(year)
+
+    if n > 0:
+        remaining = n
+        i = bisect_right(ords, start_ord)
+        while remaining > len(ords) - i:
+            remaining -= len(ords) - i
+            year += 1
+            ords = _workday_ordinals(year)
+            i = 0
+        return datetime.date.fromordinal(ords[i + remaining - 1])
+
+    remaining = -n
+    i = bisect_left(ords, start_ord)
+    while remaining > i:
+        remaining -= i
+        year -= 1
+        ords = _workday_ordinals(year)
+        i = len(ords)
+    return datetime.date.fromordinal(ords[i - remaining])
+
+
+DAY_NAMES_PL = (
+    "poniedziałek",
+    "wtorek",
+    "środa",
+    "czwartek",
+    "piątek",
+    "sobota",
+    "niedziela",
+)
+
+
+# One pattern decides the input form ('today', signed offset, or a date —
+# separated or compact ISO) and captures the fields in a single C-level scan.
+# The offset branch mirrors the old rstrip("dD")+int() tolerance ('+5dd',
+# '+5 d'); the date branches keep fromisoformat's two-digit month/day rule.
+_DATE_RE = re.compile(
+    r"(?P<today>today)"
+    r"|(?P<off>[+-]\d+)\s*d*"
+    r"|(?P<y>\d{4})[-. ](?P<m>\d{2})[-. ](?P<d>\d{2})"
+    r"|(?P<yc>\d{4})(?P<mc>\d{2})(?P<dc>\d{2})",
+    re.IGNORECASE,
+)
+
+_today_cache: Optional[datetime.date] = None
+
+
+def _today() -> datetime.date:
+    """Today's date, computed once per process (argparse may parse several dates)."""
+    global _today_cache
+    if _today_cache is None:
+        _today_cache = datetime.date.today()
+    return _today_cache
 
 
 def parse_date(date_str: str) -> datetime.date:
     """Parse date accepting ISO-like formats plus helpers: today, +Nd, -Nd."""
+    import argparse  # already in sys.modules: parse_date runs under main()
 
     # Note: Removed _range_check as we now support generic years.
-    
-    base = datetime.date.today()
+
     s = date_str.strip()
 
     if not s:
         raise argparse.ArgumentTypeError("Podaj datę.")
 
-    if s.lower() == "today":
-        return base
-
-    if s.startswith("+") or s.startswith("-"):
-        raw = s.rstrip("dD")
-        try:
-            delta_days = int(raw)
-        except ValueError:
+    match = _DATE_RE.fullmatch(s)
+    if match is None:
+        if s[0] in "+-":
             raise argparse.ArgumentTypeError(
                 f"Nieprawidłowy zapis przesunięcia: '{date_str}'. "
                 "Użyj np. +5d, -10 lub 'today'."
             )
-        dt = base + datetime.timedelta(days=delta_days)
-        return dt
+        raise argparse.ArgumentTypeError(
+            f"Nieprawidłowy format daty: '{date_str}'. "
+            "Użyj YYYY-MM-DD, YYYY.MM.DD, YYYY MM DD, 'today', +N(d) lub -N(d)."
+        )
+
+    if match.group("today"):
+        return _today()
+
+    offset = match.group("off")
+    if offset:
+        return _today() + datetime.timedelta(days=int(offset))
 
-    normalized = s.replace(".", "-").replace(" ", "-")
     try:
-        dt = datetime.date.fromisoformat(normalized)
+        return datetime.date(
+            int(match.group("y") or match.group("yc")),
+            int(match.group("m") or match.group("mc")),
+            int(match.group("d") or match.group("dc")),
+        )
     except ValueError:
         raise argparse.ArgumentTypeError(
             f"Nieprawidłowy format daty: '{date_str}'. "
             "Użyj YYYY-MM-DD, YYYY.MM.DD, YYYY MM DD, 'today', +N(d) lub -N(d)."
         )
 
-    return dt
-
 
 def fail(message: str) -> NoReturn:
     print(f"Błąd: {message}", file=sys.stderr)
@@ -263,17 +384,21 @@ def cmd_holidays(args: argparse.Namespace) -> None:
     except ValueError as e:
         fail(str(e))
 
+    # Emit the whole listing in one write instead of one print per row.
     if args.quiet:
-        for date, _name in holidays:
-            print(date)
+        sys.stdout.write("\n".join(str(date) for date, _name in holidays) + "\n")
         return
 
-    print(f"Święta ustawowe w {year} roku:")
-    print(f"{'Data':<14} {'Dzień tygodnia':<16} Nazwa")
-    print("-" * 56)
-    for date, name in holidays:
-        day_name = DAY_NAMES_PL[date.weekday()]
-        print(f"{date}     {day_name:<16} {name}")
+    lines = [
+        f"Święta ustawowe w {year} roku:",
+        f"{'Data':<14} {'Dzień tygodnia':<16} Nazwa",
+        "-" * 56,
+    ]
+    lines.extend(
+        f"{date}     {DAY_NAMES_PL[date.weekday()]:<16} {name}"
+        for date, name in holidays
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_add(args: argparse.Namespace) -> None:
@@ -309,13 +434,15 @@ Formaty dat: YYYY-MM-DD, YYYY.MM.DD, "YYYY MM DD", today, +N(d), -N(d)
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Kalkulator dni roboczych w Polsce (uwzględnia weekendy i święta).",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=HELP_EPILOG,
     )
     parser.add_argument(
-        "-v", "--version", action="version", version=f"%(prog)s {__version__}"
+        "-v", "--version", action="version", version=f"%(prog)s {_get_version()}"
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -2,7 +2,9 @@
 """Graficzny interfejs (tkinter) dla kalkulatora dni roboczych."""
 
 import calendar
+import contextlib
 import datetime
+import functools
 import tkinter as tk
 from tkinter import ttk
 
@@ -34,11 +36,20 @@ COLOR_RESULT_ERR = "#c62828"
 
 DAY_HEADERS = ["Pn", "Wt", "Śr", "Cz", "Pt", "So", "Nd"]
 
+_POLISH_MONTHS = (
+    "", "Styczeń", "Luty", "Marzec", "Kwiecień", "Maj", "Czerwiec",
+    "Lipiec", "Sierpień", "Wrzesień", "Październik", "Listopad", "Grudzień",
+)
+
+# Ready-made "(dzień tygodnia)" labels for the DatePicker, indexed by weekday().
+_DAY_LABELS = tuple(f"({name})" for name in DAY_NAMES_PL)
+
 # Dynamic supported years for GUI (current year +/- range)
 THIS_YEAR = datetime.date.today().year
 MIN_YEAR = THIS_YEAR - 50
 MAX_YEAR = THIS_YEAR + 50
 GUI_YEARS = list(range(MIN_YEAR, MAX_YEAR + 1))
+_GUI_YEAR_STRS = tuple(str(y) for y in GUI_YEARS)
 
 FONT_DAY = ("Helvetica", 12)
 FONT_DAY_HEADER = ("Helvetica", 10, "bold")
@@ -51,21 +62,68 @@ FONT_SMALL = ("Helvetica", 10)
 CELL_W = 40
 CELL_H = 30
 
+# Grid geometry is fixed, so the cell corner/center coordinates are computed
+# once here instead of in every redraw.
+COL_X0 = tuple(col * CELL_W for col in range(7))
+COL_CX = tuple(x + CELL_W // 2 for x in COL_X0)
+ROW_Y0 = tuple((row + 1) * CELL_H for row in range(6))
+ROW_CY = tuple(y + CELL_H // 2 for y in ROW_Y0)
+
+
+@functools.lru_cache(maxsize=64)
+def _month_dates(year, month):
+    """The date objects of a month, indexed by day - 1."""
+    last = calendar.monthrange(year, month)[1]
+    return tuple(datetime.date(year, month, d) for d in range(1, last + 1))
+
+
+@functools.lru_cache(maxsize=len(GUI_YEARS))
+def _holiday_rows(year):
+    """Preformatted holidays-tab rows for a year; revisited years cost only inserts."""
+    return tuple(
+        (dt.isoformat(), DAY_NAMES_PL[dt.weekday()], name)
+        for dt, name in get_holidays_with_names(year)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_holidays(year):
+    """Holiday set for a year, kept out of the draw path; empty when unsupported."""
+    try:
+        return get_holidays(year)
+    except ValueError:
+        return frozenset()
+
 
 class CalendarWidget(tk.Frame):
     """Custom month-view calendar drawn on a Canvas for clean rendering."""
 
-    def __init__(self, master, on_date_select=None, **kwargs):
+    def __init__(self, master, on_date_select=None, initial_date=None, **kwargs):
         super().__init__(master, bg=COLOR_BG, **kwargs)
         self._on_date_select = on_date_select
         today = datetime.date.today()
-        self._year = today.year
-        self._month = today.month
-        self._selected_date = None
+        shown = initial_date or today
+        self._year = shown.year
+        self._month = shown.month
+        self._selected_date = initial_date
         self._today = today
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # Last values pushed to Tk, so _refresh can skip no-op configure calls.
+        self._last_title = None
+        self._last_prev_state = None
+        self._last_next_state = None
         self._cal = calendar.Calendar(firstweekday=0)
+        self._weeks_cache = {}  # (year, month) -> monthdayscalendar() rows
         self._hover_cell = None
-        self._cells = []  # list of (row, col, day, x0, y0, x1, y1) for hit testing
+        self._hover_rc_raw = None  # raw grid position, even over empty cells
+        self._motion_after_id = None
+        self._pending_motion = None
+        self._redraw_after_id = None
+        # (r, col) -> (day, date, rect_id, text_id, base_bg, base_fg,
+        # base_outline, base_width); base_* is the appearance without hover.
+        self._cell_items = {}
+        self._rc_by_date = {}  # date -> (r, col) for the displayed month
 
         self._build_nav()
         self._build_canvas()
@@ -99,51 +157,107 @@ class CalendarWidget(tk.Frame):
         self._canvas.bind("<Motion>", self._on_canvas_motion)
         self._canvas.bind("<Leave>", self._on_canvas_leave)
 
+        # The weekday header never changes; draw it once and keep the items
+        # out of the per-month "body" redraws.
+        self._header_ids = tuple(
+            self._canvas.create_text(
+                COL_CX[col], CELL_H // 2, text=name, font=FONT_DAY_HEADER,
+                fill=COLOR_WEEKEND if col >= 5 else COLOR_NORMAL,
+            )
+            for col, name in enumerate(DAY_HEADERS)
+        )
+
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """Suspend refreshes while several states change; repaint once on exit.
+
+        Reentrant: nested uses only repaint when the outermost block ends.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._refresh()
+
     def _refresh(self):
-        month_name = self._polish_month(self._month)
-        self._lbl_title.configure(text=f"{month_name} {self._year}")
+        if self._batch_depth > 0:
+            self._batch_dirty = True
+            return
+        self._cancel_motion()
+        # The widget is long-lived now that popups are reused; re-read today
+        # so the highlight rolls over when the app runs past midnight.
+        self._today = datetime.date.today()
+        title = f"{_POLISH_MONTHS[self._month]} {self._year}"
+        if title != self._last_title:
+            self._last_title = title
+            self._lbl_title.configure(text=title)
 
         # Expanded range logic or just simple prev/next
         # We allow navigation freely within the wide GUI_YEARS range
         at_min = (self._year, self._month) <= (MIN_YEAR, 1)
         at_max = (self._year, self._month) >= (MAX_YEAR, 12)
-        self._btn_prev.configure(state="disabled" if at_min else "normal")
-        self._btn_next.configure(state="disabled" if at_max else "normal")
-
+        prev_state = "disabled" if at_min else "normal"
+        next_state = "disabled" if at_max else "normal"
+        if prev_state != self._last_prev_state:
+            self._last_prev_state = prev_state
+            self._btn_prev.configure(state=prev_state)
+        if next_state != self._last_next_state:
+            self._last_next_state = next_state
+            self._btn_next.configure(state=next_state)
+
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        # Coalesce back-to-back state changes (e.g. rapid month clicks) into
+        # a single paint on the idle loop.
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_after_id = None
         self._draw_calendar()
 
     def _draw_calendar(self):
         c = self._canvas
-        c.delete("all")
-        self._cells = []
-
-        # Draw day-of-week headers
-        for col, name in enumerate(DAY_HEADERS):
-            x = col * CELL_W + CELL_W // 2
-            y = CELL_H // 2
-            fg = COLOR_WEEKEND if col >= 5 else COLOR_NORMAL
-            c.create_text(x, y, text=name, font=FONT_DAY_HEADER, fill=fg)
-
-        weeks = self._cal.monthdayscalendar(self._year, self._month)
-        try:
-            holidays = get_holidays(self._year)
-        except ValueError:
-            holidays = set()
+        c.delete("body")
+        self._cell_items = {}
+        self._rc_by_date = {}
+
+        key = (self._year, self._month)
+        weeks = self._weeks_cache.get(key)
+        if weeks is None:
+            weeks = self._weeks_cache[key] = self._cal.monthdayscalendar(*key)
+        holidays = _cached_holidays(self._year)
+        month_dates = _month_dates(self._year, self._month)
+
+        # Hoist method, attribute and constant lookups out of the 42-cell loop.
+        create_rectangle = c.create_rectangle
+        create_text = c.create_text
+        cell_items = self._cell_items
+        rc_by_date = self._rc_by_date
+        today = self._today
+        selected = self._selected_date
+        hover_rc = self._hover_cell
 
         for r, week in enumerate(weeks):
             for col, day in enumerate(week):
-                x0 = col * CELL_W
-                y0 = (r + 1) * CELL_H
+                x0 = COL_X0[col]
+                y0 = ROW_Y0[r]
                 x1 = x0 + CELL_W
                 y1 = y0 + CELL_H
-                cx = x0 + CELL_W // 2
-                cy = y0 + CELL_H // 2
+                cx = COL_CX[col]
+                cy = ROW_CY[r]
 
                 if day == 0:
-                    c.create_rectangle(x0, y0, x1, y1, fill=COLOR_EMPTY, outline="")
+                    create_rectangle(
+                        x0, y0, x1, y1, fill=COLOR_EMPTY, outline="", tags="body",
+                    )
                     continue
 
-                dt = datetime.date(self._year, self._month, day)
+                dt = month_dates[day - 1]
                 bg = COLOR_DAY_BG
                 fg = COLOR_NORMAL
                 outline = ""
@@ -153,58 +267,134 @@ class CalendarWidget(tk.Frame):
                     fg = COLOR_WEEKEND
                 if dt in holidays:
                     fg = COLOR_HOLIDAY
-                if dt == self._today:
+                if dt == today:
                     bg = COLOR_TODAY_BG
                     fg = COLOR_TODAY_FG
                     outline = COLOR_TODAY_BORDER
                     outline_w = 2
-                if dt == self._selected_date:
-                    bg = COLOR_SELECTED_BG
-                    fg = COLOR_SELECTED_FG
-                    outline = ""
-                    outline_w = 0
-
-                # Hover highlight
-                if self._hover_cell == (r, col):
-                    if dt != self._selected_date:
-                        bg = COLOR_HOVER_BG
-
-                c.create_rectangle(
+                if dt == selected:
+                    draw_bg, draw_fg = COLOR_SELECTED_BG, COLOR_SELECTED_FG
+                    draw_outline, draw_w = "", 0
+                elif hover_rc == (r, col):
+                    draw_bg, draw_fg = COLOR_HOVER_BG, fg
+                    draw_outline, draw_w = outline, outline_w
+                else:
+                    draw_bg, draw_fg = bg, fg
+                    draw_outline, draw_w = outline, outline_w
+
+                rect_id = create_rectangle(
                     x0 + 1, y0 + 1, x1 - 1, y1 - 1,
-                    fill=bg, outline=outline, width=outline_w,
+                    fill=draw_bg, outline=draw_outline, width=draw_w, tags="body",
                 )
-                c.create_text(cx, cy, text=str(day), font=FONT_DAY, fill=fg)
+                text_id = create_text(
+                    cx, cy, text=str(day), font=FONT_DAY, fill=draw_fg, tags="body",
+                )
+
+                cell_items[(r, col)] = (
+                    day, dt, rect_id, text_id, bg, fg, outline, outline_w,
+                )
+                rc_by_date[dt] = (r, col)
 
-                self._cells.append((r, col, day, x0, y0, x1, y1))
+    def _set_hover(self, rc):
+        """Move the hover highlight by repainting only the two affected cells."""
+        old = self._hover_cell
+        if rc == old:
+            return
+        self._hover_cell = rc
+
+        if old is not None:
+            cell = self._cell_items.get(old)
+            if cell is not None:
+                _day, dt, rect_id, _text_id, bg, _fg, _outline, _w = cell
+                if dt != self._selected_date:
+                    self._canvas.itemconfigure(rect_id, fill=bg)
+        if rc is not None:
+            cell = self._cell_items.get(rc)
+            if cell is not None:
+                _day, dt, rect_id, _text_id, _bg, _fg, _outline, _w = cell
+                if dt != self._selected_date:
+                    self._canvas.itemconfigure(rect_id, fill=COLOR_HOVER_BG)
 
     def _hit_test(self, mx, my):
         """Return (row, col, day) for the cell at canvas coords, or None."""
-        for r, col, day, x0, y0, x1, y1 in self._cells:
-            if x0 <= mx < x1 and y0 <= my < y1:
-                return r, col, day
-        return None
+        # The grid is a regular lattice, so the cell follows from two integer
+        # divisions; the first canvas row is the weekday header.
+        col = mx // CELL_W
+        r = my // CELL_H - 1
+        if not (0 <= col < 7 and 0 <= r < 6):
+            return None
+        cell = self._cell_items.get((r, col))
+        if cell is None:
+            return None
+        return r, col, cell[0]
+
+    def _apply_selection(self, old_dt, new_dt):
+        """Repaint just the cells losing and gaining the selection highlight."""
+        canvas = self._canvas
+        for dt in (old_dt, new_dt):
+            if dt is None:
+                continue
+            rc = self._rc_by_date.get(dt)
+            if rc is None:  # e.g. previous selection in another month
+                continue
+            _day, _dt, rect_id, text_id, bg, fg, outline, outline_w = (
+                self._cell_items[rc]
+            )
+            if dt == self._selected_date:
+                canvas.itemconfigure(
+                    rect_id, fill=COLOR_SELECTED_BG, outline="", width=0,
+                )
+                canvas.itemconfigure(text_id, fill=COLOR_SELECTED_FG)
+            else:
+                draw_bg = COLOR_HOVER_BG if rc == self._hover_cell else bg
+                canvas.itemconfigure(
+                    rect_id, fill=draw_bg, outline=outline, width=outline_w,
+                )
+                canvas.itemconfigure(text_id, fill=fg)
 
     def _on_canvas_click(self, event):
         hit = self._hit_test(event.x, event.y)
         if hit:
-            _, _, day = hit
-            dt = datetime.date(self._year, self._month, day)
+            r, col, _day = hit
+            dt = self._cell_items[(r, col)][1]
+            old = self._selected_date
             self._selected_date = dt
-            self._refresh()
+            self._apply_selection(old, dt)
             if self._on_date_select:
                 self._on_date_select(dt)
 
     def _on_canvas_motion(self, event):
-        hit = self._hit_test(event.x, event.y)
-        new_hover = (hit[0], hit[1]) if hit else None
-        if new_hover != self._hover_cell:
-            self._hover_cell = new_hover
-            self._draw_calendar()
+        # Most motion events stay inside the current cell; two integer
+        # divisions decide that before any scheduling or hit testing.
+        rc = (event.y // CELL_H - 1, event.x // CELL_W)
+        if rc == self._hover_rc_raw:
+            return
+        self._hover_rc_raw = rc
+
+        # <Motion> fires at the pointer sample rate; remember the latest
+        # coordinates and process them at most once per ~16 ms frame.
+        self._pending_motion = (event.x, event.y)
+        if self._motion_after_id is None:
+            self._motion_after_id = self.after(16, self._flush_motion)
+
+    def _flush_motion(self):
+        self._motion_after_id = None
+        if self._pending_motion is None:
+            return
+        mx, my = self._pending_motion
+        hit = self._hit_test(mx, my)
+        self._set_hover((hit[0], hit[1]) if hit else None)
+
+    def _cancel_motion(self):
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
+        self._pending_motion = None
+        self._hover_rc_raw = None
 
     def _on_canvas_leave(self, _event):
-        if self._hover_cell is not None:
-            self._hover_cell = None
-            self._draw_calendar()
+        self._cancel_motion()
+        self._set_hover(None)
 
     def _prev_month(self):
         if self._month == 1:
@@ -233,22 +423,14 @@ class CalendarWidget(tk.Frame):
     def get_date(self):
         return self._selected_date
 
-    @staticmethod
-    def _polish_month(m):
-        names = [
-            "", "Styczeń", "Luty", "Marzec", "Kwiecień", "Maj", "Czerwiec",
-            "Lipiec", "Sierpień", "Wrzesień", "Październik", "Listopad", "Grudzień",
-        ]
-        return names[m]
-
 
 class DatePicker(tk.Frame):
     """Date entry with an inline calendar overlay for selection."""
 
     def __init__(self, master, label_text="Data:", **kwargs):
         super().__init__(master, bg=COLOR_BG, **kwargs)
-        self._cal_frame = None
-        self._escape_id = None
+        self._cal_frame = None  # built lazily on first open, then reused
+        self._cal_widget = None
         self._selected_date = datetime.date.today()
 
         tk.Label(
@@ -256,13 +438,14 @@ class DatePicker(tk.Frame):
         ).pack(side=tk.LEFT)
 
         self._entry_var = tk.StringVar(value=self._selected_date.isoformat())
+        self._last_committed = self._entry_var.get()
         self._entry = ttk.Entry(self, textvariable=self._entry_var, font=FONT_LABEL, width=12)
         self._entry.pack(side=tk.LEFT)
         self._entry.bind("<Return>", self._on_entry_commit)
         self._entry.bind("<FocusOut>", self._on_entry_commit)
 
         self._day_label = tk.Label(
-            self, text=f"({DAY_NAMES_PL[self._selected_date.weekday()]})",
+            self, text=_DAY_LABELS[self._selected_date.weekday()],
             font=FONT_SMALL, bg=COLOR_BG, fg=COLOR_WEEKEND,
             width=14, anchor=tk.W,
         )
@@ -273,19 +456,32 @@ class DatePicker(tk.Frame):
         )
         self._btn.pack(side=tk.LEFT, padx=(4, 0))
 
+        # Escape closes the calendar; bound once for the widget's lifetime
+        # instead of per popup open/close.
+        self.winfo_toplevel().bind("<Escape>", self._on_escape, add="+")
+
+    def _on_escape(self, _event=None):
+        if self._cal_frame is not None and self._cal_frame.winfo_ismapped():
+            self._close_calendar()
+
     def _on_entry_commit(self, _event=None):
         text = self._entry_var.get().strip()
+        # <FocusOut> fires when the popup steals focus right after
+        # _open_calendar already committed; skip the duplicate re-parse.
+        if text == self._last_committed:
+            return
         try:
             normalized = text.replace(".", "-").replace(" ", "-")
             dt = datetime.date.fromisoformat(normalized)
             self._selected_date = dt
             self._entry_var.set(dt.isoformat())
-            self._day_label.configure(text=f"({DAY_NAMES_PL[dt.weekday()]})")
+            self._day_label.configure(text=_DAY_LABELS[dt.weekday()])
         except ValueError:
             self._entry_var.set(self._selected_date.isoformat())
+        self._last_committed = self._entry_var.get()
 
     def _toggle_calendar(self):
-        if self._cal_frame and self._cal_frame.winfo_exists():
+        if self._cal_frame is not None and self._cal_frame.winfo_ismapped():
             self._close_calendar()
         else:
             self._open_calendar()
@@ -294,14 +490,23 @@ class DatePicker(tk.Frame):
         self._on_entry_commit()
 
         root = self.winfo_toplevel()
-        self._cal_frame = tk.Frame(root, bg=COLOR_POPUP_BORDER, relief=tk.RAISED, bd=1)
-
-        inner = tk.Frame(self._cal_frame, bg=COLOR_BG)
-        inner.pack(padx=1, pady=1)
+        if self._cal_frame is None:
+            # First open: build the overlay once; later opens just reposition it.
+            self._cal_frame = tk.Frame(
+                root, bg=COLOR_POPUP_BORDER, relief=tk.RAISED, bd=1,
+            )
+            inner = tk.Frame(self._cal_frame, bg=COLOR_BG)
+            inner.pack(padx=1, pady=1)
 
-        cal = CalendarWidget(inner, on_date_select=self._on_pick)
-        cal.set_date(self._selected_date)
-        cal.pack(padx=2, pady=2)
+            self._cal_widget = CalendarWidget(
+                inner, on_date_select=self._on_pick, initial_date=self._selected_date,
+            )
+            self._cal_widget.pack(padx=2, pady=2)
+        else:
+            # Reused popup: set_date changes selection, year and month, each
+            # of which would refresh on its own; batch them into one repaint.
+            with self._cal_widget.batch_updates():
+                self._cal_widget.set_date(self._selected_date)
 
         # Position the overlay relative to the root window
         self.update_idletasks()
@@ -310,25 +515,16 @@ class DatePicker(tk.Frame):
         self._cal_frame.place(x=rx, y=ry)
         self._cal_frame.lift()
 
-        # Escape closes the calendar
-        self._escape_id = root.bind("<Escape>", lambda _e: self._close_calendar(), add="+")
-
     def _on_pick(self, dt):
         self._selected_date = dt
         self._entry_var.set(dt.isoformat())
-        self._day_label.configure(text=f"({DAY_NAMES_PL[dt.weekday()]})")
+        self._last_committed = self._entry_var.get()
+        self._day_label.configure(text=_DAY_LABELS[dt.weekday()])
         self._close_calendar()
 
     def _close_calendar(self):
-        if self._cal_frame and self._cal_frame.winfo_exists():
-            self._cal_frame.destroy()
-        self._cal_frame = None
-        try:
-            if self._escape_id:
-                self.winfo_toplevel().unbind("<Escape>", self._escape_id)
-                self._escape_id = None
-        except (tk.TclError, ValueError, AttributeError):
-            pass
+        if self._cal_frame is not None and self._cal_frame.winfo_exists():
+            self._cal_frame.place_forget()
 
     def get_date(self):
         self._on_entry_commit()
@@ -337,7 +533,8 @@ class DatePicker(tk.Frame):
     def set_date(self, dt):
         self._selected_date = dt
         self._entry_var.set(dt.isoformat())
-        self._day_label.configure(text=f"({DAY_NAMES_PL[dt.weekday()]})")
+        self._last_committed = self._entry_var.get()
+        self._day_label.configure(text=_DAY_LABELS[dt.weekday()])
 
 
 class WorkDaysApp(tk.Tk):
@@ -479,6 +676,24 @@ class WorkDaysApp(tk.Tk):
                 text="Błąd: wpisz poprawną liczbę dni.", fg=COLOR_RESULT_ERR,
             )
             return
+        if n == 0:
+            day_name = DAY_NAMES_PL[start.weekday()]
+            self._add_result.configure(
+                text=f"Po dodaniu 0 dni roboczych od {start}:\n{start}  ({day_name})",
+                fg=COLOR_RESULT_OK,
+            )
+            return
+
+        # n work days span at least n calendar days, so a target provably
+        # outside the datetime range can be rejected before any computation.
+        projected = start.toordinal() + n
+        if projected < datetime.date.min.toordinal() or projected > datetime.date.max.toordinal():
+            self._add_result.configure(
+                text="Błąd: wynik wykracza poza zakres obsługiwanych dat (lata 1-9999).",
+                fg=COLOR_RESULT_ERR,
+            )
+            return
+
         try:
             result = add_workdays(start, n)
             day_name = DAY_NAMES_PL[result.weekday()]
@@ -509,13 +724,14 @@ class WorkDaysApp(tk.Tk):
         ).pack(side=tk.LEFT, padx=(0, 6))
 
         self._holiday_year_var = tk.StringVar(value=str(datetime.date.today().year))
+        self._holidays_after_id = None
         combo = ttk.Combobox(
             top, textvariable=self._holiday_year_var,
-            values=[str(y) for y in GUI_YEARS],
+            values=_GUI_YEAR_STRS,
             state="readonly", width=8, font=FONT_LABEL,
         )
         combo.pack(side=tk.LEFT)
-        combo.bind("<<ComboboxSelected>>", lambda _e: self._load_holidays())
+        combo.bind("<<ComboboxSelected>>", self._on_year_selected)
 
         ttk.Button(top, text="Pokaż", command=self._load_holidays).pack(
             side=tk.LEFT, padx=(10, 0),
@@ -540,18 +756,30 @@ class WorkDaysApp(tk.Tk):
 
         self._load_holidays()
 
+    def _on_year_selected(self, _event=None):
+        # Coalesce rapid selection changes (e.g. arrow-key sweeps through the
+        # combobox) into a single reload on the idle loop.
+        if self._holidays_after_id is None:
+            self._holidays_after_id = self.after_idle(self._flush_holidays)
+
+    def _flush_holidays(self):
+        self._holidays_after_id = None
+        self._load_holidays()
+
     def _load_holidays(self):
-        for item in self._tree.get_children():
-            self._tree.delete(item)
+        tree = self._tree
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
         try:
             year = int(self._holiday_year_var.get())
-            holidays = get_holidays_with_names(year)
+            rows = _holiday_rows(year)
         except (ValueError, KeyError) as e:
-            self._tree.insert("", tk.END, values=("Błąd", str(e), ""))
+            tree.insert("", tk.END, values=("Błąd", str(e), ""))
             return
-        for dt, name in holidays:
-            day_name = DAY_NAMES_PL[dt.weekday()]
-            self._tree.insert("", tk.END, values=(dt.isoformat(), day_name, name))
+        insert = tree.insert
+        for row in rows:
+            insert("", tk.END, values=row)
 
 
 def run_gui():